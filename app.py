@@ -1,137 +1,427 @@
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import geoip2.database
+import geoip2.errors
+import maxminddb
+import functools
+import itertools
 import pkgutil
 import importlib
+import importlib.util
 import logging
-import json
+import logging.handlers
+import queue
+import orjson
 import os
 import re
+import sqlite3
+import sys
+import time
+from datetime import timedelta
+from urllib.parse import quote, urlparse
+
+DOMAIN_INFO = ('div', 'domain-info')
+PERSON_INFO = ('div', 'person-info')
+RESULTS = ('div', 'result')
+GOOGLE_RESULTS = ('h3', 'r')
+
+CACHE_EXPIRY = timedelta(hours=6)
+
+log = logging.getLogger('recon')
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import h2
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import maxminddb.extension
+    HAS_MAXMINDDB_EXTENSION = True
+except ImportError:
+    HAS_MAXMINDDB_EXTENSION = False
 
 class ReconSouthAfrica:
     def __init__(self):
         self.modules = self.load_modules()
+        self._loaded_modules = {}
         self.setup_logging()
         self.config = self.load_config()
+        self.session = self.create_session()
+        self.results_cache = self.open_results_cache()
+        self._host_sems = {}
+        self._host_last = {}
+        # config.json: min_host_delay (seconds, 0 disables pacing), max_per_host (used when unpaced)
+        self._min_delay = self.config.get('min_host_delay', 1.0)
+        self._per_host_limit = 1 if self._min_delay else self.config.get('max_per_host', 8)
+        self.geoip_reader = self.open_geoip_reader()
+        if not HAS_HTTP2:
+            log.warning("h2 not installed, concurrent scrapes will use HTTP/1.1")
+        self._geoip_city = functools.lru_cache(maxsize=4096)(self._lookup_city)
+        self._pattern_cache = functools.lru_cache(maxsize=1024)(self._compile_names_pattern)
+        self._automaton_cache = functools.lru_cache(maxsize=16)(self._build_names_automaton)
+        self._menu = [
+            ("Domain Lookup", self.run_domain_lookup),
+            ("IP Geolocation", self.run_ip_geolocation),
+            ("Public Records Search", self.run_public_records),
+            ("Reverse Image Search (TinEye)", self.run_reverse_image_search),
+            ("SAPS Wanted/Missing Persons", self.run_saps_wanted_missing),
+            ("International Wanted/Missing Persons", self.run_international_wanted_missing),
+            ("Social Network Search by Email", functools.partial(self.run_social_network_search, 'email')),
+            ("Social Network Search by IP", functools.partial(self.run_social_network_search, 'ip')),
+            ("Social Network Search by VIN", functools.partial(self.run_social_network_search, 'vin')),
+            ("Real Name Search Pattern", self.run_real_name_search_pattern),
+            ("Google Dorks", self.run_google_dorks),
+            ("Username Search", self.run_username_search),
+            ("Email Address Search", self.run_email_address_search),
+            ("Compromised Databases Search", self.run_compromised_databases_search),
+            ("Phone Number Search", self.run_phone_number_search),
+            ("Whois Lookup", self.run_whois),
+            ("Reverse Whois Lookup", self.run_reverse_whois),
+            ("Passive DNS Lookup", self.run_passive_dns),
+            ("Geolocation Tools", self.run_geolocation_tools),
+            ("Help", self.print_help),
+            ("Settings", self.print_settings),
+            ("Exit", self.exit_program),
+            ("Bulk Search Tools", self.run_bulk_search_tools)
+        ]
 
     def load_modules(self):
         modules = {}
         for _, name, _ in pkgutil.iter_modules():
             if name.startswith('module_'):
-                module = importlib.import_module(name)
-                modules[name] = module
+                modules[name] = importlib.util.find_spec(name)
         return modules
 
     def setup_logging(self):
-        logging.basicConfig(filename='reconsouthafrica.log', level=logging.INFO,
-                            format='%(asctime)s:%(levelname)s:%(message)s')
+        file_handler = logging.FileHandler('reconsouthafrica.log')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s:%(message)s'))
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger()
+        self.log_handler = logging.handlers.QueueHandler(log_queue)
+        root.addHandler(self.log_handler)
+        root.setLevel(logging.INFO)
+        self.log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self.log_listener.start()
 
     def load_config(self):
         if os.path.exists('config.json'):
-            with open('config.json', 'r') as file:
-                return json.load(file)
+            with open('config.json', 'rb') as file:
+                return orjson.loads(file.read())
         else:
             return {}
 
+    def create_session(self):
+        session = requests_cache.CachedSession('recon_cache.sqlite', expire_after=CACHE_EXPIRY,
+                                               allowable_methods=('GET',))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': 'ReconSouthAfrica/1.0'})
+        return session
+
+    def open_results_cache(self):
+        connection = sqlite3.connect('recon_results.sqlite', timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('CREATE TABLE IF NOT EXISTS results '
+                           '(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, texts BLOB NOT NULL)')
+        return connection
+
+    def open_geoip_reader(self):
+        if HAS_MAXMINDDB_EXTENSION:
+            mode = maxminddb.MODE_MMAP_EXT
+        else:
+            mode = maxminddb.MODE_AUTO
+            log.warning("maxminddb C extension not available, GeoIP lookups will use the pure Python reader")
+        try:
+            return geoip2.database.Reader('GeoLite2-City.mmdb', mode=mode)
+        except (OSError, maxminddb.InvalidDatabaseError) as e:
+            log.warning("Could not open GeoLite2-City.mmdb, IP geolocation disabled: %s", e)
+            return None
+
+    def _lookup_city(self, ip_address):
+        return self.geoip_reader.city(ip_address)
+
+    def close(self):
+        self.session.close()
+        self.results_cache.close()
+        self.log_listener.stop()
+        logging.getLogger().removeHandler(self.log_handler)
+        for handler in self.log_listener.handlers:
+            handler.close()
+        if self.geoip_reader:
+            self.geoip_reader.close()
+
     def run_module(self, module_name, *args):
         if module_name in self.modules:
-            module = self.modules[module_name]
             try:
+                module = self.import_module(module_name)
                 module.run(*args)
-                logging.info(f"Successfully ran module {module_name} with args {args}")
+                log.info("Successfully ran module %s with args %s", module_name, args)
             except Exception as e:
-                logging.error(f"Error running module {module_name} with args {args}: {e}")
+                log.error("Error running module %s with args %s: %s", module_name, args, e)
                 print(f"An error occurred: {e}")
         else:
             print(f"Module {module_name} not found")
 
-    def make_request(self, url, params=None):
+    def import_module(self, module_name):
+        module = self._loaded_modules.get(module_name)
+        if module is None:
+            spec = self.modules[module_name]
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+            self._loaded_modules[module_name] = module
+        return module
+
+    def make_request(self, url, params=None, stream=False):
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=(5, 20), stream=stream)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
-            logging.error(f"Request failed: {e}")
+            log.error("Request failed: %s", e)
             print(f"Request failed: {e}")
             return None
 
-    def parse_html(self, html):
-        return BeautifulSoup(html, 'html.parser')
+    def make_request_stream(self, url, params=None):
+        with self.session.cache_disabled():
+            return self.make_request(url, params, stream=True)
+
+    def iter_matches(self, chunks, selector, limit=None):
+        name, class_ = selector
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        texts, open_slots = [], []
+        found = 0
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
+            for event, element in parser.read_events():
+                matched = element.tag == name and class_ in (element.get('class') or '').split()
+                if event == 'start':
+                    if matched:
+                        open_slots.append(len(texts))
+                        texts.append(None)
+                    continue
+                if matched:
+                    texts[open_slots.pop()] = ''.join(element.itertext())
+                if open_slots:
+                    continue
+                for text in texts:
+                    yield text
+                    found += 1
+                    if limit is not None and found >= limit:
+                        return
+                texts.clear()
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+    def _async_client(self):
+        return httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={'User-Agent': 'ReconSouthAfrica/1.0'},
+            timeout=httpx.Timeout(20.0, connect=5.0))
+
+    async def _aget(self, client, url, params=None):
+        host = urlparse(url).netloc
+        async with self._host_sems.setdefault(host, asyncio.Semaphore(self._per_host_limit)):
+            delay = self._min_delay - (time.monotonic() - self._host_last.get(host, float('-inf')))
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with self._request_sem:
+                    response = await client.get(url, params=params)
+                response.raise_for_status()
+                return response.content
+            except httpx.HTTPError as e:
+                log.error("Request failed: %s", e)
+                print(f"Request failed: {e}")
+                return None
+            finally:
+                self._host_last[host] = time.monotonic()
+
+    def _start_batch(self, limit=20):
+        self._request_sem = asyncio.Semaphore(limit)
+        self._host_sems = {}
+        return self._async_client()
+
+    async def ainput(self, prompt):
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+    def extract_texts(self, html, selector):
+        return list(self.iter_matches([html], selector, self.config.get('max_results')))
+
+    def _results_key(self, url, params, selector):
+        return ' '.join((*selector, requests.Request('GET', url, params=params).prepare().url))
+
+    def cached_results(self, url, selector, params=None):
+        row = self.results_cache.execute(
+            'SELECT texts FROM results WHERE key = ? AND stored_at > ?',
+            (self._results_key(url, params, selector), time.time() - CACHE_EXPIRY.total_seconds())).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def store_results(self, url, selector, params, texts):
+        if not texts:
+            return
+        with self.results_cache:
+            self.results_cache.execute(
+                'INSERT OR REPLACE INTO results (key, stored_at, texts) VALUES (?, ?, ?)',
+                (self._results_key(url, params, selector), time.time(), orjson.dumps(texts)))
+
+    def scrape(self, url, selector, params=None):
+        texts = self.cached_results(url, selector, params)
+        if texts is None:
+            response = self.make_request_stream(url, params)
+            if not response:
+                return None
+            try:
+                with response:
+                    texts = list(self.iter_matches(response.iter_content(chunk_size=64 * 1024), selector,
+                                                   self.config.get('max_results')))
+            except requests.exceptions.RequestException as e:
+                log.error("Request failed: %s", e)
+                print(f"Request failed: {e}")
+                return None
+            self.store_results(url, selector, params, texts)
+        return texts
+
+    async def ascrape(self, client, url, selector, params=None):
+        texts = self.cached_results(url, selector, params)
+        if texts is None:
+            html = await self._aget(client, url, params)
+            if html is None:
+                return None
+            texts = self.extract_texts(html, selector)
+            self.store_results(url, selector, params, texts)
+        return texts
+
+    async def ascrape_all(self, targets, selector, limit=20):
+        async with self._start_batch(limit) as client:
+            return await asyncio.gather(*(self.ascrape(client, url, selector, params) for url, params in targets))
+
+    def scrape_all(self, targets, selector):
+        return asyncio.run(self.ascrape_all(targets, selector))
 
     def print_menu(self):
-        print("Choose an action:")
-        menu_options = [
-            ("Domain Lookup", self.run_domain_lookup),
-            ("IP Geolocation", self.run_ip_geolocation),
-            ("Public Records Search", self.run_public_records),
-            ("Reverse Image Search (TinEye)", self.run_reverse_image_search),
-            ("SAPS Wanted/Missing Persons", self.run_saps_wanted_missing),
-            ("International Wanted/Missing Persons", self.run_international_wanted_missing),
-            ("Social Network Search by Email", lambda: self.run_social_network_search('email')),
-            ("Social Network Search by IP", lambda: self.run_social_network_search('ip')),
-            ("Social Network Search by VIN", lambda: self.run_social_network_search('vin')),
-            ("Real Name Search Pattern", self.run_real_name_search_pattern),
-            ("Google Dorks", self.run_google_dorks),
-            ("Username Search", self.run_username_search),
-            ("Email Address Search", self.run_email_address_search),
-            ("Compromised Databases Search", self.run_compromised_databases_search),
-            ("Phone Number Search", self.run_phone_number_search),
-            ("Whois Lookup", self.run_whois),
-            ("Reverse Whois Lookup", self.run_reverse_whois),
-            ("Passive DNS Lookup", self.run_passive_dns),
-            ("Geolocation Tools", self.run_geolocation_tools),
-            ("Help", self.print_help),
-            ("Settings", self.print_settings),
-            ("Exit", self.exit_program)
-        ]
-        for index, (option, _) in enumerate(menu_options, start=1):
-            print(f"{index}. {option}")
+        lines = ["Choose an action:"]
+        lines.extend(f"{index}. {option}" for index, (option, _) in enumerate(self._menu, start=1))
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def print_help(self):
-        print("Help:")
-        print("Select an option from the menu for details on each action.")
+        sys.stdout.write("Help:\n"
+                         "Select an option from the menu for details on each action.\n")
 
     def print_settings(self):
         print("Settings functionality not implemented yet.")
 
     def exit_program(self):
         print("Exiting...")
-        exit()
+        sys.exit(0)
 
     # Modules implementation
 
     def run_domain_lookup(self):
         domain = input("Enter the domain to lookup: ")
-        url = f'https://www.za-example.com/domain-lookup/{domain}'
-        response = self.make_request(url)
-        if response:
-            soup = self.parse_html(response.text)
+        url = f'https://www.za-example.com/domain-lookup/{quote(domain, safe="")}'
+        self.print_domain_info(domain, self.scrape(url, DOMAIN_INFO))
+
+    def run_domain_lookup_bulk(self):
+        domains = self.read_targets("Enter the path to a file of domains (one per line): ")
+        if domains is None:
+            return
+        results = self.scrape_all(
+            [(f'https://www.za-example.com/domain-lookup/{quote(domain, safe="")}', None) for domain in domains],
+            DOMAIN_INFO)
+        for domain, infos in zip(domains, results):
+            self.print_domain_info(domain, infos)
+
+    def read_targets(self, prompt):
+        path = input(prompt)
+        try:
+            with open(path, 'r') as file:
+                return [line.strip() for line in file if line.strip()]
+        except OSError as e:
+            print(f"Failed to read {path}: {e}")
+            return None
+
+    def print_domain_info(self, domain, infos):
+        if infos is not None:
             print(f"Domain Information for {domain}:")
-            for info in soup.find_all('div', class_='domain-info'):
-                print(info.text)
+            for info in infos:
+                print(info)
         else:
             print(f"Failed to retrieve data for {domain}")
 
     def run_ip_geolocation(self):
         ip_address = input("Enter the IP address to geolocate: ")
+        if not self.geoip_reader:
+            print("IP geolocation unavailable: GeoLite2-City.mmdb could not be opened")
+            return
         try:
-            with geoip2.database.Reader('GeoLite2-City.mmdb') as reader:
-                response = reader.city(ip_address)
-                print(f"Geolocation for IP {ip_address}:")
-                print(f"City: {response.city.name}")
-                print(f"Country: {response.country.name}")
-                print(f"Latitude: {response.location.latitude}")
-                print(f"Longitude: {response.location.longitude}")
+            response = self._geoip_city(ip_address)
+            print(f"Geolocation for IP {ip_address}:")
+            print(f"City: {response.city.name}")
+            print(f"Country: {response.country.name}")
+            print(f"Latitude: {response.location.latitude}")
+            print(f"Longitude: {response.location.longitude}")
         except Exception as e:
-            logging.error(f"Failed to geolocate IP address {ip_address}: {e}")
+            log.error("Failed to geolocate IP address %s: %s", ip_address, e)
             print(f"Failed to geolocate IP address {ip_address}: {e}")
 
+    def run_ip_geolocation_bulk(self, ips=None):
+        if ips is None:
+            ips = self.read_targets("Enter the path to a file of IP addresses (one per line): ")
+            if ips is None:
+                return
+        if not self.geoip_reader:
+            print("IP geolocation unavailable: GeoLite2-City.mmdb could not be opened")
+            return
+        lookup = self._geoip_city
+        out = ['\t'.join(('IP', 'City', 'Country', 'Latitude', 'Longitude'))]
+        errors = []
+        for ip_address in ips:
+            try:
+                response = lookup(ip_address)
+            except (geoip2.errors.AddressNotFoundError, maxminddb.InvalidDatabaseError, ValueError) as e:
+                log.error("Failed to geolocate IP address %s: %s", ip_address, e)
+                errors.append(f"Failed to geolocate IP address {ip_address}: {e}")
+                out.append('\t'.join((ip_address, '', '', '', '')))
+                continue
+            out.append('\t'.join((ip_address, str(response.city.name), str(response.country.name),
+                                  str(response.location.latitude), str(response.location.longitude))))
+        sys.stdout.write('\n'.join(out) + '\n')
+        if errors:
+            sys.stderr.write('\n'.join(errors) + '\n')
+
     def run_public_records(self):
         name = input("Enter the name to search public records: ")
-        url = f'https://www.sa-publicrecords-example.com/search?name={name}'
-        response = self.make_request(url)
+        response = self.make_request('https://www.sa-publicrecords-example.com/search', params={'name': name})
         if response:
-            data = response.json()
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                log.error("Invalid public records response for %s: %s", name, e)
+                print(f"Failed to decode public records for {name}")
+                return
             print(f"Public Records for {name}:")
             for record in data['records']:
                 print(record)
@@ -140,70 +430,110 @@ class ReconSouthAfrica:
 
     def run_reverse_image_search(self):
         image_url = input("Enter the image URL for reverse image search: ")
-        url = f'https://tineye.com/search?url={image_url}'
-        response = self.make_request(url)
-        if response:
-            soup = self.parse_html(response.text)
+        results = self.scrape('https://tineye.com/search', RESULTS, params={'url': image_url})
+        if results is not None:
             print(f"Reverse Image Search Results for {image_url}:")
-            results = soup.find_all('div', class_='result')
             for result in results:
-                print(result.text)
+                print(result)
         else:
             print(f"Failed to perform reverse image search for {image_url}")
 
     def run_saps_wanted_missing(self):
         search_term = input("Enter the search term for SAPS wanted/missing persons: ")
-        url = f'https://www.saps.gov.za/crimestop/wanted/search.php?q={search_term}'
-        response = self.make_request(url)
-        if response:
-            soup = self.parse_html(response.text)
+        persons = self.scrape('https://www.saps.gov.za/crimestop/wanted/search.php', PERSON_INFO,
+                              params={'q': search_term})
+        if persons is not None:
             print(f"SAPS Wanted/Missing Persons for {search_term}:")
-            for person in soup.find_all('div', class_='person-info'):
-                print(person.text)
+            for person in persons:
+                print(person)
         else:
             print(f"Failed to retrieve SAPS wanted/missing persons for {search_term}")
 
     def run_international_wanted_missing(self):
         search_term = input("Enter the search term for international wanted/missing persons: ")
-        url = f'https://www.interpol.int/en/How-we-work/Notices/View-Red-Notices?q={search_term}'
-        response = self.make_request(url)
-        if response:
-            soup = self.parse_html(response.text)
+        persons = self.scrape('https://www.interpol.int/en/How-we-work/Notices/View-Red-Notices', RESULTS,
+                              params={'q': search_term})
+        if persons is not None:
             print(f"International Wanted/Missing Persons for {search_term}:")
-            for person in soup.find_all('div', class_='result'):
-                print(person.text)
+            for person in persons:
+                print(person)
         else:
             print(f"Failed to retrieve international wanted/missing persons for {search_term}")
 
-    def run_social_network_search(self, search_type):
-        query = input(f"Enter the {search_type} for social network search: ")
-        url = f'https://www.socialnetworksearch-example.com/search?{search_type}={query}'
-        response = self.make_request(url)
-        if response:
-            soup = self.parse_html(response.text)
-            print(f"Social Network Search Results for {search_type} {query}:")
-            for result in soup.find_all('div', class_='result'):
-                print(result.text)
-        else:
-            print(f"Failed to perform social network search for {search_type} {query}")
+    def run_social_network_search(self, *search_types):
+        queries, results = asyncio.run(self._social_network_search(search_types))
+        for (search_type, query), texts in zip(queries, results):
+            if texts is not None:
+                print(f"Social Network Search Results for {search_type} {query}:")
+                for result in texts:
+                    print(result)
+            else:
+                print(f"Failed to perform social network search for {search_type} {query}")
+
+    async def _social_network_search(self, search_types):
+        async with self._start_batch() as client:
+            queries, pending = [], []
+            for search_type in search_types:
+                query = await self.ainput(f"Enter the {search_type} for social network search: ")
+                queries.append((search_type, query))
+                pending.append(asyncio.create_task(self.ascrape(
+                    client, 'https://www.socialnetworksearch-example.com/search', RESULTS,
+                    params={search_type: query})))
+            return queries, await asyncio.gather(*pending)
 
     def run_real_name_search_pattern(self):
-        name = input("Enter the real name for pattern search: ")
+        name = input("Enter the real name(s) for pattern search (comma-separated): ")
+        names = [n.strip() for n in name.split(',') if n.strip()]
         print(f"Searching for patterns matching real name: {name}")
-        pattern = re.compile(r'\b' + re.escape(name) + r'\b', re.IGNORECASE)
         sample_text = "Example text with real name John Doe and other content."
-        matches = pattern.findall(sample_text)
+        matches = self.find_names(names, sample_text)
         print(f"Found {len(matches)} matches for name {name} in sample text.")
 
+    def _compile_names_pattern(self, names):
+        alternation = '|'.join(map(re.escape, sorted(names, key=len, reverse=True)))
+        return re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+
+    def find_names(self, names, text):
+        names = tuple(dict.fromkeys(names))
+        if not names:
+            return []
+        if len(names) > 1000 and ahocorasick:
+            return self._find_names_automaton(names, text)
+        return self._pattern_cache(names).findall(text)
+
+    def _build_names_automaton(self, names):
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            folded = name.lower()
+            automaton.add_word(folded, len(folded))
+        automaton.make_automaton()
+        return automaton
+
+    def _find_names_automaton(self, names, text):
+        folded = text.lower()
+        source = text if len(folded) == len(text) else folded
+        candidates = []
+        for end, length in self._automaton_cache(names).iter(folded):
+            start = end - length + 1
+            before = folded[start - 1] if start > 0 else ' '
+            after = folded[end + 1] if end + 1 < len(folded) else ' '
+            if not (before.isalnum() or before == '_' or after.isalnum() or after == '_'):
+                candidates.append((start, end + 1))
+        matches = []
+        last_end = 0
+        for start, end in sorted(candidates, key=lambda span: (span[0], -span[1])):
+            if start >= last_end:
+                matches.append(source[start:end])
+                last_end = end
+        return matches
+
     def run_google_dorks(self):
         search_query = input("Enter the Google Dorks query: ")
-        url = f'https://www.google.com/search?q={search_query}'
-        response = self.make_request(url)
-        if response:
-            soup = self.parse_html(response.text)
+        results = self.scrape('https://www.google.com/search', GOOGLE_RESULTS, params={'q': search_query})
+        if results is not None:
             print(f"Google Dorks Search Results for query: {search_query}")
-            for result in soup.find_all('h3', class_='r'):
-                print(result.text)
+            for result in results:
+                print(result)
         else:
             print(f"Failed to perform Google Dorks search for query: {search_query}")
 
@@ -243,61 +573,64 @@ class ReconSouthAfrica:
         print(f"Passive DNS information for {query}.")
 
     def run_geolocation_tools(self):
-        print("Geolocation Tools:")
-        print("1. IP-based Geolocation")
-        print("2. Location Search")
-        choice = input("Enter your choice (1-2): ")
+        sys.stdout.write("Geolocation Tools:\n"
+                         "1. IP-based Geolocation\n"
+                         "2. Location Search\n"
+                         "3. IP-based Geolocation (bulk from file)\n")
+        choice = input("Enter your choice (1-3): ")
         if choice == '1':
             self.run_ip_geolocation()
         elif choice == '2':
             location = input("Enter the location to search: ")
             print(f"Performing location search for: {location}")
             print(f"Location information for {location}.")
+        elif choice == '3':
+            self.run_ip_geolocation_bulk()
+
+    def run_bulk_search_tools(self):
+        sys.stdout.write("Bulk Search Tools:\n"
+                         "1. Domain Lookup (bulk from file)\n"
+                         "2. Social Network Search (all types)\n")
+        choice = input("Enter your choice (1-2): ")
+        if choice == '1':
+            self.run_domain_lookup_bulk()
+        elif choice == '2':
+            self.run_social_network_search('email', 'ip', 'vin')
+
+    def prompt_menu(self):
+        self.print_menu()
+        sys.stdout.write(f"Enter your choice (1-{len(self._menu)}): ")
+        sys.stdout.flush()
 
     def start(self):
-        while True:
-            self.print_menu()
+        if not sys.stdout.isatty():
+            sys.stdout.reconfigure(line_buffering=False)
+        self.prompt_menu()
+        for line in iter(sys.stdin.readline, ''):
             try:
-                choice = int(input("Enter your choice (1-22): ").strip())
-                if 1 <= choice <= 22:
-                    if choice == 20:
-                        self.print_help()
-                    elif choice == 21:
-                        self.print_settings()
-                    elif choice == 22:
-                        self.exit_program()
-                    else:
-                        self.run_menu_choice(choice)
+                choice = int(line.strip())
+                if 1 <= choice <= len(self._menu):
+                    self.run_menu_choice(choice)
                 else:
-                    print("Invalid choice. Please enter a number between 1 and 22.")
+                    print(f"Invalid choice. Please enter a number between 1 and {len(self._menu)}.")
             except ValueError:
                 print("Invalid input. Please enter a number.")
+            except EOFError:
+                print()
+                break
+            self.prompt_menu()
+        self.exit_program()
 
     def run_menu_choice(self, choice):
-        menu_options = [
-            self.run_domain_lookup,
-            self.run_ip_geolocation,
-            self.run_public_records,
-            self.run_reverse_image_search,
-            self.run_saps_wanted_missing,
-            self.run_international_wanted_missing,
-            lambda: self.run_social_network_search('email'),
-            lambda: self.run_social_network_search('ip'),
-            lambda: self.run_social_network_search('vin'),
-            self.run_real_name_search_pattern,
-            self.run_google_dorks,
-            self.run_username_search,
-            self.run_email_address_search,
-            self.run_compromised_databases_search,
-            self.run_phone_number_search,
-            self.run_whois,
-            self.run_reverse_whois,
-            self.run_passive_dns,
-            self.run_geolocation_tools
-        ]
-        menu_options[choice - 1]()
+        self._menu[choice - 1][1]()
 
 if __name__ == "__main__":
     recon = ReconSouthAfrica()
-    recon.start()
+    try:
+        recon.start()
+    except Exception:
+        log.exception("Unhandled error")
+        raise
+    finally:
+        recon.close()
 